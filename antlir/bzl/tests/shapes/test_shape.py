@@ -5,6 +5,7 @@
 # LICENSE file in the root directory of this source tree.
 
 import importlib
+import pickle
 import unittest
 from typing import Mapping, Optional, Sequence, Tuple
 
@@ -32,6 +33,23 @@ characters = character_collection_t.from_env("characters").characters
 TARGET_PATH = "antlir//antlir/bzl/tests/shapes" # @oss-enable
 
 
+# generated shape classes rewrite their __qualname__, so pickle can only find
+# a user-written subclass
+class PicklableHashable(hashable_t):
+    pass
+
+
+def _trooper(cls=hashable_t, **kwargs):
+    fields = {
+        "name": "Stormtrooper",
+        "appears_in": [1, 2, 3, 4, 5, 6],
+        "lightsaber_color": "red",
+        "metadata": {"species": "clone"},
+    }
+    fields.update(kwargs)
+    return cls(**fields)
+
+
 class TestShape(unittest.TestCase):
     def setUp(self):
         # More output for easier debugging
@@ -82,17 +100,39 @@ class TestShape(unittest.TestCase):
         self.assertEqual(target.name, f"{TARGET_PATH}:luke-lightsaber")
 
     def test_hash(self):
-        trooper1 = hashable_t(
-            name="Stormtrooper",
-            appears_in=[1, 2, 3, 4, 5, 6],
-            friends=[],
-        )
-        trooper2 = hashable_t(
-            name="Stormtrooper",
-            appears_in=[1, 2, 3, 4, 5, 6],
-            friends=[],
-        )
-        self.assertEqual(trooper1.__hash__(), trooper2.__hash__())
+        self.assertEqual(_trooper().__hash__(), _trooper().__hash__())
+
+    def test_hash_cached(self):
+        trooper1 = _trooper()
+        trooper2 = _trooper()
+        h = hash(trooper1)
+        # the first hash() stores the result, and later calls reuse it
+        self.assertEqual(h, object.__getattribute__(trooper1, "_cached_hash"))
+        self.assertEqual(h, hash(trooper1))
+        # the cached value does not leak into fields, repr or equality
+        self.assertNotIn("_cached_hash", trooper1.__dict__)
+        self.assertNotIn("_cached_hash", repr(trooper1))
+        self.assertEqual(repr(trooper1), repr(trooper2))
+        self.assertEqual(trooper1, trooper2)
+        # the cached value is returned even if the fields are swapped out
+        # underneath it
+        swapped = _trooper()
+        swapped_hash = hash(swapped)
+        vader = _trooper(name="Vader")
+        object.__setattr__(swapped, "__dict__", dict(vader.__dict__))
+        self.assertEqual(swapped_hash, hash(swapped))
+        # copies don't inherit the cache, and hash their new values
+        clone = trooper1.copy(update={"name": "Clonetrooper"})
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(clone, "_cached_hash")
+        self.assertNotEqual(h, hash(clone))
+        # pickling drops the slot, so the hash is recomputed after loading
+        picklable = _trooper(PicklableHashable)
+        picklable_hash = hash(picklable)
+        loaded = pickle.loads(pickle.dumps(picklable))
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(loaded, "_cached_hash")
+        self.assertEqual(picklable_hash, hash(loaded))
 
     def test_typehints(self):
         """check type hints on generated classes"""
@@ -68,6 +68,11 @@ class frozendict(Mapping, tuple, DoNotFreeze):
     def __ne__(self, other) -> bool:
         return not self == other
 
+    def __reduce__(self):
+        # the wrapped `MappingProxyType` cannot be pickled, so rebuild from
+        # a plain dict instead
+        return (type(self), (dict(tuple.__getitem__(self, 0)),))
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({repr(dict(tuple.__getitem__(self, 0)))})"
 
@@ -68,6 +68,10 @@ class ShapeMeta(ModelMetaclass):
 
 
 class Shape(BaseModel, DoNotFreeze, metaclass=ShapeMeta):
+    # shapes are immutable, so the hash is computed once and then cached in
+    # this slot (deliberately not a field, so it stays out of __dict__)
+    __slots__ = ("_cached_hash",)
+
     class Config:
         allow_mutation = False
 
@@ -94,7 +98,12 @@ class Shape(BaseModel, DoNotFreeze, metaclass=ShapeMeta):
         return cls.parse_raw(os.environ[envvar])
 
     def __hash__(self) -> int:
-        return hash((type(self), *self.__dict__.values()))
+        try:
+            return object.__getattribute__(self, "_cached_hash")
+        except AttributeError:
+            h = hash((type(self), *self.__dict__.values()))
+            object.__setattr__(self, "_cached_hash", h)
+            return h
 
     def __repr__(self) -> str:
         """